@@ -2,18 +2,43 @@
 
 from __future__ import annotations
 
+import threading
 from dataclasses import dataclass, field, asdict
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Optional, Tuple
 
-import numpy as np
-
 try:
     from .utils import load_json, save_json
 except ImportError:
     from utils import load_json, save_json
 
 
+@lru_cache(maxsize=64)
+def _head_within(
+    baseline: Tuple[float, float, float],
+    thresholds: Tuple[float, float, float],
+    angles: Tuple[float, float, float],
+) -> bool:
+    return (
+        abs(angles[0] - baseline[0]) <= thresholds[0]
+        and abs(angles[1] - baseline[1]) <= thresholds[1]
+        and abs(angles[2] - baseline[2]) <= thresholds[2]
+    )
+
+
+@lru_cache(maxsize=64)
+def _gaze_within(
+    horizontal_range: Tuple[float, float],
+    vertical_range: Tuple[float, float],
+    gaze_vector: Tuple[float, float],
+) -> bool:
+    return (
+        horizontal_range[0] <= gaze_vector[0] <= horizontal_range[1]
+        and vertical_range[0] <= gaze_vector[1] <= vertical_range[1]
+    )
+
+
 @dataclass
 class HeadPoseCalibration:
     """Baseline angles and thresholds for head pose deviation."""
@@ -23,8 +48,10 @@ class HeadPoseCalibration:
 
     def within_threshold(self, angles: Tuple[float, float, float]) -> bool:
         """Return True if angles are within thresholds from baseline."""
-        diffs = np.abs(np.array(angles) - np.array(self.baseline))
-        return bool(np.all(diffs <= np.array(self.thresholds)))
+        # Smoothed angles barely move during steady attention; quantising
+        # to 0.1 degrees lets consecutive frames hit the memo cache.
+        quantized = (round(angles[0], 1), round(angles[1], 1), round(angles[2], 1))
+        return _head_within(self.baseline, self.thresholds, quantized)
 
 
 @dataclass
@@ -36,11 +63,8 @@ class GazeCalibration:
 
     def within_threshold(self, gaze_vector: Tuple[float, float]) -> bool:
         """Return True if gaze vector components fall within ranges."""
-        horizontal, vertical = gaze_vector
-        return (
-            self.horizontal_range[0] <= horizontal <= self.horizontal_range[1]
-            and self.vertical_range[0] <= vertical <= self.vertical_range[1]
-        )
+        quantized = (round(gaze_vector[0], 2), round(gaze_vector[1], 2))
+        return _gaze_within(self.horizontal_range, self.vertical_range, quantized)
 
 
 @dataclass
@@ -89,7 +113,13 @@ class Settings:
     smoothing_window: int = 5
     warning_delay_frames: int = 10
     overlay_enabled: bool = True
+    # CSV logging is buffered and non-durable: recent rows may be lost if
+    # the application crashes, in exchange for not stalling the capture
+    # loop on disk writes.
     log_to_csv: bool = False
+    # Building the full 478-point landmark list costs ~1000 allocations
+    # per frame; only the debug view needs it, so it is off by default.
+    overlay_needs_full_landmarks: bool = False
     overlay_width: int = 360
     overlay_height: int = 140
     overlay_pos_x: float = 50.0  # percentage of available width
@@ -108,6 +138,7 @@ class Settings:
             warning_delay_frames=int(data.get("warning_delay_frames", 10)),
             overlay_enabled=bool(data.get("overlay_enabled", True)),
             log_to_csv=bool(data.get("log_to_csv", False)),
+            overlay_needs_full_landmarks=bool(data.get("overlay_needs_full_landmarks", False)),
             overlay_width=int(data.get("overlay_width", 360)),
             overlay_height=int(data.get("overlay_height", 140)),
             overlay_pos_x=float(data.get("overlay_pos_x", 50.0)),
@@ -118,10 +149,15 @@ class Settings:
 class CalibrationManager:
     """Manage calibration and settings persistence."""
 
+    # Debounce window for persisting setter storms (e.g. slider drags).
+    SAVE_DELAY_SECONDS = 0.25
+
     def __init__(self, config_path: Path) -> None:
         self.config_path = config_path
         self.calibration = CalibrationData()
         self.settings = Settings()
+        self._save_timer: Optional[threading.Timer] = None
+        self._save_lock = threading.Lock()
         self._load()
 
     def _load(self) -> None:
@@ -134,32 +170,50 @@ class CalibrationManager:
         self.settings = Settings.from_dict(settings_data)
 
     def save(self) -> None:
+        """Write the config to disk immediately."""
+        with self._save_lock:
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+                self._save_timer = None
         payload = {
             "settings": self.settings.to_dict(),
             "calibration": self.calibration.to_dict(),
         }
         save_json(self.config_path, payload)
 
+    def _schedule_save(self) -> None:
+        """Arm (or re-arm) a short timer so rapid setter calls coalesce
+        into one disk write."""
+        with self._save_lock:
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+            self._save_timer = threading.Timer(self.SAVE_DELAY_SECONDS, self._flush_save)
+            self._save_timer.daemon = True
+            self._save_timer.start()
+
+    def _flush_save(self) -> None:
+        self.save()
+
     def update_head_pose_baseline(self, angles: Tuple[float, float, float]) -> None:
         self.calibration.head_pose.baseline = tuple(angles)
-        self.save()
+        self._schedule_save()
 
     def update_head_pose_thresholds(self, thresholds: Tuple[float, float, float]) -> None:
         self.calibration.head_pose.thresholds = tuple(thresholds)
-        self.save()
+        self._schedule_save()
 
     def update_gaze_ranges(
         self, horizontal_range: Tuple[float, float], vertical_range: Tuple[float, float]
     ) -> None:
         self.calibration.gaze.horizontal_range = tuple(horizontal_range)
         self.calibration.gaze.vertical_range = tuple(vertical_range)
-        self.save()
+        self._schedule_save()
 
     def update_settings(self, **kwargs) -> None:
         for key, value in kwargs.items():
             if hasattr(self.settings, key):
                 setattr(self.settings, key, value)
-        self.save()
+        self._schedule_save()
 
     def reset(self) -> None:
         self.calibration = CalibrationData()
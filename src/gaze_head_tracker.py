@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 import csv
+import math
+import queue
 import threading
 import time
 from dataclasses import dataclass
@@ -14,6 +16,11 @@ import mediapipe as mp
 import numpy as np
 from PySide6 import QtCore
 
+try:
+    from numba import njit
+except ImportError:  # pragma: no cover - numba is optional
+    njit = None
+
 try:
     from .calibration import CalibrationManager
     from .utils import MovingAverageFilter, rotation_vector_to_euler
@@ -34,6 +41,10 @@ GAZE_SAMPLES_PER_STEP = 45
 
 LEFT_IRIS_LANDMARKS = [468, 469, 470, 471, 472]
 RIGHT_IRIS_LANDMARKS = [473, 474, 475, 476, 477]
+EYE_CORNER_LANDMARKS = [33, 133, 362, 263]
+# Highest landmark index touched by the gaze kernel; computed once so the
+# per-frame bounds check is a single comparison.
+MAX_GAZE_LANDMARK = max(max(LEFT_IRIS_LANDMARKS), max(RIGHT_IRIS_LANDMARKS), max(EYE_CORNER_LANDMARKS))
 
 MODEL_3D_POINTS = np.array(
     [
@@ -48,6 +59,70 @@ MODEL_3D_POINTS = np.array(
 )
 
 FACE_LANDMARK_INDICES = [1, 152, 263, 33, 291, 61]
+FACE_LANDMARK_INDICES_ARR = np.array(FACE_LANDMARK_INDICES, dtype=np.int32)
+MAX_PNP_LANDMARK = int(FACE_LANDMARK_INDICES_ARR.max())
+
+# SQPnP (OpenCV >= 4.5) is non-iterative and much cheaper than the
+# Levenberg-Marquardt based ITERATIVE solver for our six correspondences.
+PNP_FLAGS = getattr(cv2, "SOLVEPNP_SQPNP", cv2.SOLVEPNP_ITERATIVE)
+
+PAYLOAD_KEYS = (
+    "head_angles",
+    "gaze_vector",
+    "iris_positions",
+    "head_pose_within",
+    "gaze_within",
+    "attention_ok",
+    "landmarks",
+    "calibration_target",
+)
+
+
+def _gaze_kernel(pix: np.ndarray) -> Tuple[float, float, float, float, float, float]:
+    """Pure scalar gaze maths over the landmark pixel array.
+
+    Returns (horizontal, vertical, left_cx, left_cy, right_cx, right_cy).
+    Kept free of Python objects so it can be JIT-compiled when numba is
+    installed.
+    """
+    left_cx = (pix[468, 0] + pix[469, 0] + pix[470, 0] + pix[471, 0] + pix[472, 0]) * 0.2
+    left_cy = (pix[468, 1] + pix[469, 1] + pix[470, 1] + pix[471, 1] + pix[472, 1]) * 0.2
+    right_cx = (pix[473, 0] + pix[474, 0] + pix[475, 0] + pix[476, 0] + pix[477, 0]) * 0.2
+    right_cy = (pix[473, 1] + pix[474, 1] + pix[475, 1] + pix[476, 1] + pix[477, 1]) * 0.2
+
+    left_start_x = pix[33, 0]
+    left_start_y = pix[33, 1]
+    left_end_x = pix[133, 0]
+    left_end_y = pix[133, 1]
+    left_width = math.hypot(left_end_x - left_start_x, left_end_y - left_start_y)
+    left_height = abs(left_start_y - left_end_y) + 1e-5
+    left_h = (left_cx - (left_start_x + left_end_x) * 0.5) / (left_width + 1e-5)
+    left_v = (left_cy - (left_start_y + left_end_y) * 0.5) / left_height
+
+    right_start_x = pix[362, 0]
+    right_start_y = pix[362, 1]
+    right_end_x = pix[263, 0]
+    right_end_y = pix[263, 1]
+    right_width = math.hypot(right_end_x - right_start_x, right_end_y - right_start_y)
+    right_height = abs(right_start_y - right_end_y) + 1e-5
+    right_h = (right_cx - (right_start_x + right_end_x) * 0.5) / (right_width + 1e-5)
+    right_v = (right_cy - (right_start_y + right_end_y) * 0.5) / right_height
+
+    return (
+        (left_h + right_h) * 0.5,
+        (left_v + right_v) * 0.5,
+        left_cx,
+        left_cy,
+        right_cx,
+        right_cy,
+    )
+
+
+if njit is not None:
+    _gaze_kernel = njit(cache=True, fastmath=True)(_gaze_kernel)
+    # Warm the JIT at import time so the first tracked frame does not pay
+    # compilation latency on the capture thread.
+    _gaze_kernel(np.zeros((478, 2), dtype=np.float32))
 
 
 @dataclass
@@ -55,7 +130,7 @@ class TrackingResult:
     """Container for per-frame tracking outputs."""
 
     frame: np.ndarray
-    landmarks: Optional[List[Tuple[float, float]]] = None
+    landmarks: Optional[np.ndarray] = None  # (N, 2) int32 pixel coordinates
     head_angles: Optional[Tuple[float, float, float]] = None
     gaze_vector: Optional[Tuple[float, float]] = None
     iris_positions: Optional[Tuple[Tuple[float, float], Tuple[float, float]]] = None
@@ -81,6 +156,11 @@ class GazeHeadTracker(QtCore.QObject):
         self._capture: Optional[cv2.VideoCapture] = None
         self._stop_event = threading.Event()
         self._thread: Optional[threading.Thread] = None
+        self._process_thread: Optional[threading.Thread] = None
+        # Latest-wins handoff between the capture and processing threads:
+        # when processing falls behind, stale frames are dropped rather
+        # than queued, keeping camera-read latency low.
+        self._frame_queue: "queue.Queue[np.ndarray]" = queue.Queue(maxsize=1)
 
         self._face_mesh = mp.solutions.face_mesh.FaceMesh(
             max_num_faces=1,
@@ -96,14 +176,46 @@ class GazeHeadTracker(QtCore.QObject):
         self._latest_result: Optional[TrackingResult] = None
         self._frames_outside_threshold = 0
 
+        # Payload structure is fixed; update these in place and only copy
+        # on emission instead of building fresh dicts every frame.
+        self._payload_buf: Dict = dict.fromkeys(PAYLOAD_KEYS)
+        self._status_buf: Dict = dict.fromkeys(PAYLOAD_KEYS + ("warning_active", "warning_message"))
+        # Shared payload for frames without a face (common when the user
+        # steps away); only the warning keys vary, so no per-frame fill.
+        self._empty_payload: Dict = dict.fromkeys(PAYLOAD_KEYS)
+        self._empty_payload.update(head_pose_within=False, gaze_within=False, attention_ok=False)
+
         self._calibration_mode: Optional[str] = None
-        self._head_pose_samples: List[Tuple[float, float, float]] = []
-        self._gaze_samples: Dict[str, List[Tuple[float, float]]] = {}
+        # Calibration accumulates running sums and extrema rather than
+        # per-sample lists, so memory stays O(1) regardless of sample count.
+        self._head_pose_sum = [0.0, 0.0, 0.0]
+        self._head_pose_count = 0
+        self._gaze_step_count = 0
+        self._gaze_min = [math.inf, math.inf]
+        self._gaze_max = [-math.inf, -math.inf]
         self._current_step_index = 0
         self._current_target: Optional[Tuple[float, float]] = None
 
         self._csv_writer: Optional[csv.writer] = None
         self._csv_file_handle = None
+        self._csv_buffer: List[Tuple] = []
+        self._last_csv_flush = 0.0
+
+        # Camera intrinsics depend only on the frame resolution, which is
+        # constant for a capture session; rebuild only when it changes.
+        self._intrinsics_shape: Optional[Tuple[int, int]] = None
+        self._camera_matrix: Optional[np.ndarray] = None
+        self._dist_coeffs = np.zeros((4, 1), dtype=np.float32)
+
+        # Persistent destination buffer for the BGR->RGB conversion fed to
+        # MediaPipe, avoiding a fresh full-frame allocation per frame.
+        self._rgb_buf: Optional[np.ndarray] = None
+
+        # FaceMesh cost scales with pixel count; run detection on a
+        # downscaled copy. Landmarks are normalised, so pixel conversions
+        # against the full-resolution frame stay correct.
+        self._detect_scale = 0.5
+        self._small_buf: Optional[np.ndarray] = None
         
         # Camera error tracking
         self._camera_error_shown = False
@@ -111,24 +223,29 @@ class GazeHeadTracker(QtCore.QObject):
         self._frame_read_error_count = 0
 
     def start(self) -> None:
-        """Start the capture loop in a background thread."""
+        """Start the capture and processing loops in background threads."""
         if self._thread and self._thread.is_alive():
             return
         self._stop_event.clear()
         self._thread = threading.Thread(target=self._capture_loop, daemon=True)
+        self._process_thread = threading.Thread(target=self._process_loop, daemon=True)
         self._thread.start()
+        self._process_thread.start()
 
     def stop(self) -> None:
         """Stop capture and release resources."""
         self._stop_event.set()
         if self._thread:
             self._thread.join(timeout=2.0)
+        if self._process_thread:
+            self._process_thread.join(timeout=2.0)
         self._release_resources()
 
     def _release_resources(self) -> None:
         if self._capture and self._capture.isOpened():
             self._capture.release()
         if self._csv_file_handle:
+            self._flush_csv_buffer()
             self._csv_file_handle.close()
             self._csv_file_handle = None
             self._csv_writer = None
@@ -142,7 +259,19 @@ class GazeHeadTracker(QtCore.QObject):
             return False
         
         index = self._calibration_manager.settings.camera_index
-        self._capture = cv2.VideoCapture(index, cv2.CAP_DSHOW if hasattr(cv2, "CAP_DSHOW") else 0)
+        # Prefer MSMF over DSHOW on Windows; DSHOW defaults to uncompressed
+        # YUY2, roughly doubling USB bandwidth versus MJPG.
+        backends = [
+            backend
+            for name in ("CAP_MSMF", "CAP_DSHOW")
+            if (backend := getattr(cv2, name, None)) is not None
+        ]
+        backends.append(0)
+        for backend in backends:
+            self._capture = cv2.VideoCapture(index, backend)
+            if self._capture.isOpened():
+                break
+        self._capture.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*"MJPG"))
         width = self._calibration_manager.settings.frame_width
         height = self._calibration_manager.settings.frame_height
         self._capture.set(cv2.CAP_PROP_FRAME_WIDTH, width)
@@ -161,19 +290,7 @@ class GazeHeadTracker(QtCore.QObject):
         return True
 
     def _capture_loop(self) -> None:
-        """Read frames until stop event triggers."""
-        warning_message = ""
-        warning_active = False
-        last_emit = time.time()
-        fps_limit = 1.0 / 30.0
-
-        if self._calibration_manager.settings.log_to_csv and self._log_dir:
-            self._log_dir.mkdir(parents=True, exist_ok=True)
-            csv_path = self._log_dir / "tracking_log.csv"
-            self._csv_file_handle = csv_path.open("w", newline="", encoding="utf-8")
-            self._csv_writer = csv.writer(self._csv_file_handle)
-            self._csv_writer.writerow(["timestamp", "yaw", "pitch", "roll", "gaze_horizontal", "gaze_vertical"])
-
+        """Read frames and hand them to the processing thread."""
         while not self._stop_event.is_set():
             if not self._ensure_capture():
                 time.sleep(1.0)
@@ -189,18 +306,61 @@ class GazeHeadTracker(QtCore.QObject):
                     self._camera_retry_requested = False
                 time.sleep(0.5)
                 continue
-            
+
             # Successfully read frame, reset error counter
             self._frame_read_error_count = 0
 
+            try:
+                self._frame_queue.put_nowait(frame)
+            except queue.Full:
+                # Processing is behind: replace the stale frame.
+                try:
+                    self._frame_queue.get_nowait()
+                except queue.Empty:
+                    pass
+                try:
+                    self._frame_queue.put_nowait(frame)
+                except queue.Full:
+                    pass
+
+    def _process_loop(self) -> None:
+        """Run tracking on captured frames until stop event triggers."""
+        warning_message = ""
+        warning_active = False
+        last_emit = time.time()
+        fps_limit = 1.0 / 30.0
+
+        if self._calibration_manager.settings.log_to_csv and self._log_dir:
+            self._log_dir.mkdir(parents=True, exist_ok=True)
+            csv_path = self._log_dir / "tracking_log.csv"
+            # Logging is debug telemetry, not a ledger: use a large block
+            # buffer and never flush or fsync on the hot path.
+            self._csv_file_handle = csv_path.open(
+                "w", newline="", encoding="utf-8", buffering=1 << 20
+            )
+            self._csv_writer = csv.writer(self._csv_file_handle)
+            self._csv_writer.writerow(["timestamp", "yaw", "pitch", "roll", "gaze_horizontal", "gaze_vertical"])
+
+        while not self._stop_event.is_set():
+            try:
+                frame = self._frame_queue.get(timeout=0.1)
+            except queue.Empty:
+                continue
+
+            # FaceMesh is the dominant per-frame cost: skip frames that the
+            # 30 fps emit window would discard anyway. During calibration
+            # every frame is processed to keep the sampling rate up.
+            current_time = time.time()
+            emit_due = current_time - last_emit >= fps_limit
+            if not emit_due and not self._calibration_mode:
+                continue
+
             result = self._process_frame(frame)
             self._latest_result = result
 
-            current_time = time.time()
-            if current_time - last_emit >= fps_limit:
+            if emit_due and result:
                 last_emit = current_time
-                if result:
-                    self.frame_ready.emit(result.frame, self._result_to_payload(result))
+                self.frame_ready.emit(result.frame, self._result_to_payload(result))
 
             if result.head_pose_within and result.gaze_within:
                 self._frames_outside_threshold = 0
@@ -220,33 +380,60 @@ class GazeHeadTracker(QtCore.QObject):
                     warning_active = False
 
             self._emit_status(result, warning_active, warning_message)
-            time.sleep(0.001)
-
-        self._release_resources()
 
     def _emit_status(self, result: TrackingResult, warning_active: bool, message: str) -> None:
-        payload = self._result_to_payload(result)
+        if result.head_angles is None and result.gaze_vector is None:
+            # Copy before the warning keys go in so the shared no-face
+            # payload keeps its fixed PAYLOAD_KEYS shape.
+            payload = self._empty_payload.copy()
+            payload["calibration_target"] = self._current_target
+        else:
+            payload = self._fill_payload(self._status_buf, result).copy()
         payload["warning_active"] = warning_active
         payload["warning_message"] = message
         self.status_updated.emit(payload)
         self.warning_state_changed.emit(warning_active, message)
 
-    def _result_to_payload(self, result: TrackingResult) -> Dict:
-        payload: Dict = {
-            "head_angles": result.head_angles,
-            "gaze_vector": result.gaze_vector,
-            "iris_positions": result.iris_positions,
-            "head_pose_within": result.head_pose_within,
-            "gaze_within": result.gaze_within,
-            "attention_ok": result.attention_ok,
-            "landmarks": result.landmarks,
-            "calibration_target": self._current_target,
-        }
+    def _fill_payload(self, payload: Dict, result: TrackingResult) -> Dict:
+        payload["head_angles"] = result.head_angles
+        payload["gaze_vector"] = result.gaze_vector
+        payload["iris_positions"] = result.iris_positions
+        payload["head_pose_within"] = result.head_pose_within
+        payload["gaze_within"] = result.gaze_within
+        payload["attention_ok"] = result.attention_ok
+        payload["landmarks"] = result.landmarks
+        payload["calibration_target"] = self._current_target
         return payload
 
+    def _result_to_payload(self, result: TrackingResult) -> Dict:
+        if result.head_angles is None and result.gaze_vector is None:
+            self._empty_payload["calibration_target"] = self._current_target
+            return self._empty_payload.copy()
+        return self._fill_payload(self._payload_buf, result).copy()
+
     def _process_frame(self, frame: np.ndarray) -> TrackingResult:
-        rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-        results = self._face_mesh.process(rgb_frame)
+        detect_frame = frame
+        if self._detect_scale != 1.0:
+            detect_width = max(1, int(frame.shape[1] * self._detect_scale))
+            detect_height = max(1, int(frame.shape[0] * self._detect_scale))
+            detect_shape = (detect_height, detect_width, frame.shape[2])
+            if self._small_buf is None or self._small_buf.shape != detect_shape:
+                self._small_buf = np.empty(detect_shape, dtype=frame.dtype)
+            cv2.resize(
+                frame,
+                (detect_width, detect_height),
+                dst=self._small_buf,
+                interpolation=cv2.INTER_AREA,
+            )
+            detect_frame = self._small_buf
+        if self._rgb_buf is None or self._rgb_buf.shape != detect_frame.shape:
+            self._rgb_buf = np.empty_like(detect_frame)
+        self._rgb_buf.flags.writeable = True
+        cv2.cvtColor(detect_frame, cv2.COLOR_BGR2RGB, dst=self._rgb_buf)
+        # MediaPipe treats read-only frames as immutable and skips an
+        # internal copy.
+        self._rgb_buf.flags.writeable = False
+        results = self._face_mesh.process(self._rgb_buf)
         track_result = TrackingResult(frame=frame)
 
         if not results.multi_face_landmarks:
@@ -254,31 +441,35 @@ class GazeHeadTracker(QtCore.QObject):
 
         face_landmarks = results.multi_face_landmarks[0]
         image_rows, image_cols, _ = frame.shape
-        track_result.landmarks = [
-            (int(lm.x * image_cols), int(lm.y * image_rows)) for lm in face_landmarks.landmark
-        ]
-        points_2d = []
-        for idx in FACE_LANDMARK_INDICES:
-            landmark = face_landmarks.landmark[idx]
-            point = (landmark.x * image_cols, landmark.y * image_rows)
-            points_2d.append(point)
-        if len(points_2d) != len(MODEL_3D_POINTS):
+        # Materialise every landmark into one (N, 2) array so downstream
+        # consumers can slice it instead of looping over landmark objects.
+        landmark_list = face_landmarks.landmark
+        raw = np.fromiter(
+            (value for lm in landmark_list for value in (lm.x, lm.y)),
+            dtype=np.float32,
+            count=2 * len(landmark_list),
+        ).reshape(-1, 2)
+        pix = raw * np.array([image_cols, image_rows], dtype=np.float32)
+        if self._calibration_manager.settings.overlay_needs_full_landmarks:
+            track_result.landmarks = pix.astype(np.int32)
+        if pix.shape[0] <= MAX_PNP_LANDMARK:
             return track_result
 
-        points_2d_np = np.array(points_2d, dtype=np.float32)
-        focal_length = image_cols
-        camera_matrix = np.array(
-            [[focal_length, 0, image_cols / 2], [0, focal_length, image_rows / 2], [0, 0, 1]],
-            dtype=np.float32,
-        )
-        dist_coeffs = np.zeros((4, 1), dtype=np.float32)
+        points_2d_np = pix[FACE_LANDMARK_INDICES_ARR]
+        if self._intrinsics_shape != (image_cols, image_rows):
+            focal_length = image_cols
+            self._camera_matrix = np.array(
+                [[focal_length, 0, image_cols / 2], [0, focal_length, image_rows / 2], [0, 0, 1]],
+                dtype=np.float32,
+            )
+            self._intrinsics_shape = (image_cols, image_rows)
 
         success, rotation_vec, _ = cv2.solvePnP(
             MODEL_3D_POINTS,
             points_2d_np,
-            camera_matrix,
-            dist_coeffs,
-            flags=cv2.SOLVEPNP_ITERATIVE,
+            self._camera_matrix,
+            self._dist_coeffs,
+            flags=PNP_FLAGS,
         )
         if not success:
             return track_result
@@ -290,7 +481,7 @@ class GazeHeadTracker(QtCore.QObject):
         head_pose_within = self._calibration_manager.calibration.head_pose.within_threshold(smoothed_angles)
         track_result.head_pose_within = head_pose_within
 
-        gaze_data = self._compute_gaze_vector(face_landmarks, frame)
+        gaze_data = self._compute_gaze_vector(pix)
         if gaze_data is not None:
             gaze_vector, iris_positions = gaze_data
             smoothed_gaze = tuple(self._gaze_filter.add(gaze_vector))
@@ -310,67 +501,15 @@ class GazeHeadTracker(QtCore.QObject):
         return track_result
 
     def _compute_gaze_vector(
-        self, landmarks, frame: np.ndarray
+        self, pix: np.ndarray
     ) -> Optional[Tuple[Tuple[float, float], Tuple[Tuple[float, float], Tuple[float, float]]]]:
-        height, width, _ = frame.shape
-
-        def landmark_xy_pixels(index: int) -> np.ndarray:
-            lm = landmarks.landmark[index]
-            return np.array([lm.x * width, lm.y * height], dtype=np.float32)
-
-        left_center = self._estimate_iris_center(LEFT_IRIS_LANDMARKS, landmarks, width, height)
-        right_center = self._estimate_iris_center(RIGHT_IRIS_LANDMARKS, landmarks, width, height)
-
-        left_eye_coords = [landmark_xy_pixels(idx) for idx in (33, 133)]
-        right_eye_coords = [landmark_xy_pixels(idx) for idx in (362, 263)]
-
-        def compute_vector(eye_center, eye_corner_pair):
-            if eye_center is None:
-                return None
-            eye_start = eye_corner_pair[0]
-            eye_end = eye_corner_pair[1]
-            eye_center_ref = (eye_start + eye_end) / 2.0
-            eye_width = np.linalg.norm(eye_end - eye_start)
-            eye_height = abs(eye_corner_pair[0][1] - eye_corner_pair[1][1]) + 1e-5
-            vector = np.array(eye_center) - eye_center_ref
-            horizontal = vector[0] / (eye_width + 1e-5)
-            vertical = vector[1] / (eye_height + 1e-5)
-            return horizontal, vertical
-
-        left_vector = compute_vector(left_center, left_eye_coords)
-        right_vector = compute_vector(right_center, right_eye_coords)
-
-        vectors = [vec for vec in (left_vector, right_vector) if vec is not None]
-        if not vectors:
-            return None
-        mean_vector = np.mean(vectors, axis=0)
-        gaze_vector = (float(mean_vector[0]), float(mean_vector[1]))
-        
-        iris_positions = None
-        if left_center is not None and right_center is not None:
-            iris_positions = (
-                (float(left_center[0]), float(left_center[1])),
-                (float(right_center[0]), float(right_center[1])),
-            )
-        
-        return gaze_vector, iris_positions
-
-    def _estimate_iris_center(
-        self,
-        indices: List[int],
-        face_landmarks,
-        frame_width: int,
-        frame_height: int,
-    ) -> Optional[np.ndarray]:
-        pts = []
-        for idx in indices:
-            landmark = face_landmarks.landmark[idx]
-            pts.append((landmark.x, landmark.y))
-        if not pts:
+        if pix.shape[0] <= MAX_GAZE_LANDMARK:
             return None
-        pts_np = np.array(pts, dtype=np.float32)
-        center = np.mean(pts_np, axis=0)
-        return np.array([center[0] * frame_width, center[1] * frame_height], dtype=np.float32)
+        horizontal, vertical, left_cx, left_cy, right_cx, right_cy = _gaze_kernel(pix)
+        return (
+            (float(horizontal), float(vertical)),
+            ((float(left_cx), float(left_cy)), (float(right_cx), float(right_cy))),
+        )
 
     def _handle_calibration_updates(self, result: TrackingResult) -> None:
         if not self._calibration_mode:
@@ -378,33 +517,48 @@ class GazeHeadTracker(QtCore.QObject):
 
         if self._calibration_mode == "head_pose":
             if result.head_angles:
-                self._head_pose_samples.append(result.head_angles)
+                self._head_pose_sum[0] += result.head_angles[0]
+                self._head_pose_sum[1] += result.head_angles[1]
+                self._head_pose_sum[2] += result.head_angles[2]
+                self._head_pose_count += 1
                 self.calibration_step.emit(
                     "Collecting head pose baseline…",
-                    min(len(self._head_pose_samples), HEAD_POSE_SAMPLE_COUNT),
+                    min(self._head_pose_count, HEAD_POSE_SAMPLE_COUNT),
                     HEAD_POSE_SAMPLE_COUNT,
                 )
-            if len(self._head_pose_samples) >= HEAD_POSE_SAMPLE_COUNT:
-                averages = np.mean(self._head_pose_samples, axis=0)
-                self._calibration_manager.update_head_pose_baseline(tuple(float(x) for x in averages))
+            if self._head_pose_count >= HEAD_POSE_SAMPLE_COUNT:
+                count = self._head_pose_count
+                # The sums accumulate float32 from the smoothing filter;
+                # convert to builtin floats so the config stays JSON-able.
+                baseline = tuple(float(value) / count for value in self._head_pose_sum)
+                self._calibration_manager.update_head_pose_baseline(baseline)
                 self._head_filter.reset()
-                self._head_pose_samples.clear()
+                self._reset_head_pose_accumulator()
                 self._calibration_mode = None
                 self.calibration_finished.emit("Head pose calibration completed.")
 
         elif self._calibration_mode == "gaze":
             if not result.gaze_vector:
                 return
-            instruction, step_key, target = GAZE_CALIBRATION_STEPS[self._current_step_index]
-            samples = self._gaze_samples.setdefault(step_key, [])
-            samples.append(result.gaze_vector)
+            instruction, _, target = GAZE_CALIBRATION_STEPS[self._current_step_index]
+            horizontal, vertical = result.gaze_vector
+            if horizontal < self._gaze_min[0]:
+                self._gaze_min[0] = horizontal
+            if horizontal > self._gaze_max[0]:
+                self._gaze_max[0] = horizontal
+            if vertical < self._gaze_min[1]:
+                self._gaze_min[1] = vertical
+            if vertical > self._gaze_max[1]:
+                self._gaze_max[1] = vertical
+            self._gaze_step_count += 1
             self._current_target = target
             self.calibration_step.emit(
                 instruction,
-                min(len(samples), GAZE_SAMPLES_PER_STEP),
+                min(self._gaze_step_count, GAZE_SAMPLES_PER_STEP),
                 GAZE_SAMPLES_PER_STEP,
             )
-            if len(samples) >= GAZE_SAMPLES_PER_STEP:
+            if self._gaze_step_count >= GAZE_SAMPLES_PER_STEP:
+                self._gaze_step_count = 0
                 self._current_step_index += 1
                 if self._current_step_index >= len(GAZE_CALIBRATION_STEPS):
                     self._finalise_gaze_calibration()
@@ -413,25 +567,24 @@ class GazeHeadTracker(QtCore.QObject):
                     self._current_target = next_target
                     self.calibration_step.emit(next_instruction, 0, GAZE_SAMPLES_PER_STEP)
 
-    def _finalise_gaze_calibration(self) -> None:
-        horizontal_values = []
-        vertical_values = []
-        for samples in self._gaze_samples.values():
-            horizontal_values.extend([sample[0] for sample in samples])
-            vertical_values.extend([sample[1] for sample in samples])
-        if horizontal_values and vertical_values:
-            horizontal_min = float(min(horizontal_values))
-            horizontal_max = float(max(horizontal_values))
-            vertical_min = float(min(vertical_values))
-            vertical_max = float(max(vertical_values))
+    def _reset_head_pose_accumulator(self) -> None:
+        self._head_pose_sum = [0.0, 0.0, 0.0]
+        self._head_pose_count = 0
 
+    def _reset_gaze_accumulator(self) -> None:
+        self._gaze_step_count = 0
+        self._gaze_min = [math.inf, math.inf]
+        self._gaze_max = [-math.inf, -math.inf]
+
+    def _finalise_gaze_calibration(self) -> None:
+        if self._gaze_min[0] <= self._gaze_max[0] and self._gaze_min[1] <= self._gaze_max[1]:
             margin = 0.05
             self._calibration_manager.update_gaze_ranges(
-                (horizontal_min - margin, horizontal_max + margin),
-                (vertical_min - margin, vertical_max + margin),
+                (float(self._gaze_min[0]) - margin, float(self._gaze_max[0]) + margin),
+                (float(self._gaze_min[1]) - margin, float(self._gaze_max[1]) + margin),
             )
         self._gaze_filter.reset()
-        self._gaze_samples.clear()
+        self._reset_gaze_accumulator()
         self._calibration_mode = None
         self._current_step_index = 0
         self._current_target = None
@@ -439,13 +592,13 @@ class GazeHeadTracker(QtCore.QObject):
 
     def start_head_pose_calibration(self) -> None:
         self._calibration_mode = "head_pose"
-        self._head_pose_samples.clear()
+        self._reset_head_pose_accumulator()
         self._current_target = None
         self.calibration_step.emit("Hold your head in a neutral position", 0, HEAD_POSE_SAMPLE_COUNT)
 
     def start_gaze_calibration(self) -> None:
         self._calibration_mode = "gaze"
-        self._gaze_samples.clear()
+        self._reset_gaze_accumulator()
         self._current_step_index = 0
         instruction, _, target = GAZE_CALIBRATION_STEPS[0]
         self._current_target = target
@@ -453,8 +606,8 @@ class GazeHeadTracker(QtCore.QObject):
 
     def cancel_calibration(self) -> None:
         self._calibration_mode = None
-        self._head_pose_samples.clear()
-        self._gaze_samples.clear()
+        self._reset_head_pose_accumulator()
+        self._reset_gaze_accumulator()
         self._current_step_index = 0
         self._current_target = None
         self.calibration_finished.emit("Calibration cancelled.")
@@ -486,22 +639,34 @@ class GazeHeadTracker(QtCore.QObject):
     def set_smoothing_window(self, window_size: int) -> None:
         window_size = max(1, int(window_size))
         self._calibration_manager.update_settings(smoothing_window=window_size)
-        self._head_filter = MovingAverageFilter(window_size=window_size)
-        self._gaze_filter = MovingAverageFilter(window_size=window_size)
+        self._head_filter.resize(window_size)
+        self._gaze_filter.resize(window_size)
 
     def _log_result(self, result: TrackingResult) -> None:
         if not self._csv_writer:
             return
         if not result.head_angles or not result.gaze_vector:
             return
-        self._csv_writer.writerow(
-            [
-                time.time(),
+        now = time.time()
+        self._csv_buffer.append(
+            (
+                now,
                 result.head_angles[0],
                 result.head_angles[1],
                 result.head_angles[2],
                 result.gaze_vector[0],
                 result.gaze_vector[1],
-            ]
+            )
         )
+        # Batch rows to amortise encode and write syscall overhead; this is
+        # debug telemetry, so losing the tail on a crash is acceptable.
+        if len(self._csv_buffer) >= 128 or now - self._last_csv_flush > 1.0:
+            self._flush_csv_buffer()
+
+    def _flush_csv_buffer(self) -> None:
+        if not self._csv_writer or not self._csv_buffer:
+            return
+        self._csv_writer.writerows(self._csv_buffer)
+        self._csv_buffer.clear()
+        self._last_csv_flush = time.time()
 
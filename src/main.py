@@ -20,28 +20,95 @@ except ImportError:
     from overlay import OverlayWindow
 
 
-class VideoWidget(QtWidgets.QLabel):
-    """Widget that displays video frames with overlays."""
+# Plus-shaped stamp used to draw landmark dots via one fancy-index write
+# instead of one cv2.circle call per landmark.
+LANDMARK_DOT_OFFSETS = np.array([(0, 0), (-1, 0), (1, 0), (0, -1), (0, 1)], dtype=np.int32)
+LANDMARK_DOT_COLOR = (0, 200, 120)
 
-    def __init__(self) -> None:
-        super().__init__()
-        self.setScaledContents(False)
-        self.setFixedSize(640, 480)
-        self.setSizePolicy(QtWidgets.QSizePolicy.Fixed, QtWidgets.QSizePolicy.Fixed)
-        self.setStyleSheet("background-color: #f0f4f8; border: 1px solid #cbd5e1;")
 
-    def set_frame(
+class FrameRenderer:
+    """Draws tracking overlays into reusable buffers and wraps them as QImages.
+
+    Runs on the tracker thread so the GUI thread only uploads the finished
+    image. Two buffers alternate, keeping the image handed to the GUI valid
+    while the next frame is drawn.
+    """
+
+    def __init__(self) -> None:
+        self._buffers: list[Optional[Tuple[np.ndarray, QtGui.QImage]]] = [None, None]
+        self._buffer_index = 0
+        # Two slots, like the drawn path: the previous no-draw frame's
+        # backing array must stay alive while the GUI thread may still be
+        # uploading its wrapped image.
+        self._plain_refs: list[Optional[np.ndarray]] = [None, None]
+        self._plain_index = 0
+        # Rendered text strips keyed by the displayed lines; consecutive
+        # frames usually round to the same strings, so blitting a cached
+        # strip replaces re-rasterising the glyphs every frame.
+        self._text_cache: Dict[Tuple[str, ...], Tuple[np.ndarray, np.ndarray]] = {}
+
+    def render(
         self,
         frame: np.ndarray,
-        landmarks: Optional[list[tuple[int, int]]] = None,
+        landmarks: Optional[np.ndarray] = None,
         head_angles: Optional[Tuple[float, float, float]] = None,
         gaze_vector: Optional[Tuple[float, float]] = None,
         iris_positions: Optional[Tuple[Tuple[float, float], Tuple[float, float]]] = None,
-    ) -> None:
-        frame_to_draw = frame.copy()
-        if landmarks:
-            for x, y in landmarks:
-                cv2.circle(frame_to_draw, (x, y), 1, (0, 200, 120), -1)
+    ) -> QtGui.QImage:
+        has_landmarks = landmarks is not None and len(landmarks) > 0
+        if not (has_landmarks or iris_positions or head_angles or gaze_vector):
+            # Nothing to draw (warm-up, tracking loss): wrap the emitted
+            # frame directly and skip the full-frame copy. The reference
+            # keeps the buffer alive while Qt reads it. Sliced or padded
+            # frames would silently force QImage into a copying path, so
+            # only re-pack when the stride is not exactly width * 3.
+            if frame.flags["C_CONTIGUOUS"] and frame.strides[0] == frame.shape[1] * 3:
+                plain = frame
+            else:
+                plain = np.ascontiguousarray(frame)
+            self._plain_index ^= 1
+            self._plain_refs[self._plain_index] = plain
+            height, width, channel = plain.shape
+            qimage = QtGui.QImage(
+                plain.data,
+                width,
+                height,
+                channel * width,
+                QtGui.QImage.Format_BGR888,
+            )
+            # A 1.0 ratio keeps the pixmap conversion from rescaling on
+            # high-DPI screens; the video widget scales via the fast blit.
+            qimage.setDevicePixelRatio(1.0)
+            return qimage
+        self._buffer_index ^= 1
+        entry = self._buffers[self._buffer_index]
+        if entry is None or entry[0].shape != frame.shape:
+            scratch = np.ascontiguousarray(np.empty_like(frame))
+            height, width, channel = scratch.shape
+            qimage = QtGui.QImage(
+                scratch.data,
+                width,
+                height,
+                channel * width,
+                QtGui.QImage.Format_BGR888,
+            )
+            qimage.setDevicePixelRatio(1.0)
+            entry = (scratch, qimage)
+            self._buffers[self._buffer_index] = entry
+        frame_to_draw, qimage = entry
+        np.copyto(frame_to_draw, frame)
+        if has_landmarks:
+            # Landmarks arrive as a contiguous (N, 2) int32 array, so this
+            # is a no-op view rather than a per-tuple conversion.
+            pts = np.asarray(landmarks, dtype=np.int32)
+            stamped = (pts[:, None, :] + LANDMARK_DOT_OFFSETS[None, :, :]).reshape(-1, 2)
+            np.clip(
+                stamped,
+                0,
+                (frame_to_draw.shape[1] - 1, frame_to_draw.shape[0] - 1),
+                out=stamped,
+            )
+            frame_to_draw[stamped[:, 1], stamped[:, 0]] = LANDMARK_DOT_COLOR
         
         if iris_positions:
             left_iris, right_iris = iris_positions
@@ -61,10 +128,29 @@ class VideoWidget(QtWidgets.QLabel):
             overlay_lines.append(f"Gaze horizontal: {horizontal:+.2f}")
             overlay_lines.append(f"Gaze vertical: {vertical:+.2f}")
         
-        for index, line in enumerate(overlay_lines):
+        if overlay_lines:
+            strip, mask = self._get_text_strip(tuple(overlay_lines))
+            strip_height = min(strip.shape[0], frame_to_draw.shape[0])
+            strip_width = min(strip.shape[1], frame_to_draw.shape[1])
+            np.copyto(
+                frame_to_draw[:strip_height, :strip_width],
+                strip[:strip_height, :strip_width],
+                where=mask[:strip_height, :strip_width],
+            )
+
+        return qimage
+
+    def _get_text_strip(self, lines: Tuple[str, ...]) -> Tuple[np.ndarray, np.ndarray]:
+        """Return a cached (strip, mask) pair of rendered overlay text."""
+        entry = self._text_cache.get(lines)
+        if entry is not None:
+            return entry
+        height = 24 + 22 * len(lines)
+        strip = np.zeros((height, 400, 3), dtype=np.uint8)
+        for index, line in enumerate(lines):
             position = (12, 24 + index * 22)
             cv2.putText(
-                frame_to_draw,
+                strip,
                 line,
                 position,
                 cv2.FONT_HERSHEY_SIMPLEX,
@@ -74,7 +160,7 @@ class VideoWidget(QtWidgets.QLabel):
                 cv2.LINE_AA,
             )
             cv2.putText(
-                frame_to_draw,
+                strip,
                 line,
                 position,
                 cv2.FONT_HERSHEY_SIMPLEX,
@@ -83,12 +169,65 @@ class VideoWidget(QtWidgets.QLabel):
                 1,
                 cv2.LINE_AA,
             )
-        
-        rgb_frame = cv2.cvtColor(frame_to_draw, cv2.COLOR_BGR2RGB)
-        height, width, channel = rgb_frame.shape
-        bytes_per_line = channel * width
-        qt_image = QtGui.QImage(rgb_frame.data, width, height, bytes_per_line, QtGui.QImage.Format_RGB888)
-        self.setPixmap(QtGui.QPixmap.fromImage(qt_image))
+        mask = strip.any(axis=2, keepdims=True)
+        if len(self._text_cache) >= 64:
+            self._text_cache.pop(next(iter(self._text_cache)))
+        self._text_cache[lines] = (strip, mask)
+        return strip, mask
+
+
+class VideoWidget(QtWidgets.QLabel):
+    """Widget that displays rendered video frames."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.setScaledContents(False)
+        self.setFixedSize(640, 480)
+        self.setSizePolicy(QtWidgets.QSizePolicy.Fixed, QtWidgets.QSizePolicy.Fixed)
+        self.setStyleSheet("background-color: #f0f4f8; border: 1px solid #cbd5e1;")
+        self._resize_buf: Optional[np.ndarray] = None
+        self._resize_ref: Optional[np.ndarray] = None
+
+    def set_image(self, image: QtGui.QImage) -> None:
+        # A pixmap whose size and device pixel ratio match the label takes
+        # Qt's direct blit path; any mismatch costs a bilinear scale pass
+        # on every paint, so resize once here instead. The target is the
+        # label's size in *device* pixels — sizing to the logical size and
+        # then raising the ratio would shrink the video on HiDPI screens.
+        ratio = self.devicePixelRatioF()
+        target_width = round(self.width() * ratio)
+        target_height = round(self.height() * ratio)
+        if image.width() != target_width or image.height() != target_height:
+            image = self._resized(image, target_width, target_height)
+        image.setDevicePixelRatio(ratio)
+        self.setPixmap(QtGui.QPixmap.fromImage(image, QtCore.Qt.NoFormatConversion))
+
+    def _resized(self, image: QtGui.QImage, target_width: int, target_height: int) -> QtGui.QImage:
+        height = image.height()
+        width = image.width()
+        src = (
+            np.frombuffer(image.constBits(), dtype=np.uint8)
+            .reshape(height, image.bytesPerLine())[:, : width * 3]
+            .reshape(height, width, 3)
+        )
+        if self._resize_buf is None or self._resize_buf.shape[:2] != (target_height, target_width):
+            self._resize_buf = np.empty((target_height, target_width, 3), dtype=np.uint8)
+        interpolation = cv2.INTER_AREA if target_width < width else cv2.INTER_LINEAR
+        cv2.resize(
+            src,
+            (target_width, target_height),
+            dst=self._resize_buf,
+            interpolation=interpolation,
+        )
+        # Keep the scratch referenced while Qt reads the wrapped image.
+        self._resize_ref = self._resize_buf
+        return QtGui.QImage(
+            self._resize_buf.data,
+            target_width,
+            target_height,
+            target_width * 3,
+            QtGui.QImage.Format_BGR888,
+        )
 
 
 class OverlayPreview(QtWidgets.QWidget):
@@ -99,6 +238,14 @@ class OverlayPreview(QtWidgets.QWidget):
         self.setFixedSize(220, 140)
         self._screen_size = QtCore.QSize(1920, 1080)
         self._overlay_config = (320, 140, 50.0, 12.0)
+        self._last_config: Optional[Tuple[int, int, float, float, int, int]] = None
+        # Paint resources are constant; building them per paintEvent churns
+        # short-lived Python/C++ objects at repaint rate.
+        self._bg_color = QtGui.QColor("#f1f5f9")
+        self._pen_screen = QtGui.QPen(QtGui.QColor("#94a3b8"), 1.2)
+        self._brush_screen = QtGui.QBrush(QtGui.QColor("#ffffff"))
+        self._pen_overlay = QtGui.QPen(QtGui.QColor("#0f172a"), 1.0)
+        self._brush_overlay = QtGui.QBrush(QtGui.QColor(15, 118, 110, 160))
 
     def update_preview(
         self,
@@ -108,6 +255,17 @@ class OverlayPreview(QtWidgets.QWidget):
         pos_x_percent: float,
         pos_y_percent: float,
     ) -> None:
+        new_config = (
+            overlay_width,
+            overlay_height,
+            pos_x_percent,
+            pos_y_percent,
+            screen_size.width(),
+            screen_size.height(),
+        )
+        if new_config == self._last_config:
+            return
+        self._last_config = new_config
         if screen_size.width() > 0 and screen_size.height() > 0:
             self._screen_size = screen_size
         self._overlay_config = (overlay_width, overlay_height, pos_x_percent, pos_y_percent)
@@ -116,7 +274,7 @@ class OverlayPreview(QtWidgets.QWidget):
     def paintEvent(self, event: QtGui.QPaintEvent) -> None:  # noqa: D401
         painter = QtGui.QPainter(self)
         painter.setRenderHint(QtGui.QPainter.Antialiasing)
-        painter.fillRect(self.rect(), QtGui.QColor("#f1f5f9"))
+        painter.fillRect(self.rect(), self._bg_color)
 
         margin = 12
         screen_rect = QtCore.QRectF(
@@ -125,8 +283,8 @@ class OverlayPreview(QtWidgets.QWidget):
             self.width() - 2 * margin,
             self.height() - 2 * margin,
         )
-        painter.setPen(QtGui.QPen(QtGui.QColor("#94a3b8"), 1.2))
-        painter.setBrush(QtGui.QColor("#ffffff"))
+        painter.setPen(self._pen_screen)
+        painter.setBrush(self._brush_screen)
         painter.drawRoundedRect(screen_rect, 10, 10)
 
         overlay_width, overlay_height, pos_x, pos_y = self._overlay_config
@@ -135,8 +293,10 @@ class OverlayPreview(QtWidgets.QWidget):
 
         width_ratio = min(overlay_width / screen_width, 1.0)
         height_ratio = min(overlay_height / screen_height, 1.0)
-        x_ratio = np.clip(pos_x / 100.0, 0.0, 1.0)
-        y_ratio = np.clip(pos_y / 100.0, 0.0, 1.0)
+        # max/min over np.clip: these are scalars painted at UI rate, and
+        # NumPy dispatch is orders of magnitude slower for single values.
+        x_ratio = max(0.0, min(1.0, pos_x / 100.0))
+        y_ratio = max(0.0, min(1.0, pos_y / 100.0))
 
         overlay_width_px = max(screen_rect.width() * width_ratio, 6.0)
         overlay_height_px = max(screen_rect.height() * height_ratio, 6.0)
@@ -152,8 +312,8 @@ class OverlayPreview(QtWidgets.QWidget):
             overlay_width_px,
             overlay_height_px,
         )
-        painter.setPen(QtGui.QPen(QtGui.QColor("#0f172a"), 1.0))
-        painter.setBrush(QtGui.QColor(15, 118, 110, 160))
+        painter.setPen(self._pen_overlay)
+        painter.setBrush(self._brush_overlay)
         painter.drawRoundedRect(overlay_rect, 8, 8)
         painter.end()
 
@@ -170,6 +330,28 @@ class CalibrationOverlayWindow(QtWidgets.QWidget):
         self.setAttribute(QtCore.Qt.WA_ShowWithoutActivating, True)
         self._target: Optional[Tuple[float, float]] = None
         self._message: str = ""
+        self._prev_target_px: Optional[Tuple[int, int]] = None
+        # Constant paint resources, cached to avoid rebuilding them on
+        # every repaint of the calibration overlay.
+        self._dim_color = QtGui.QColor(9, 14, 23, 120)
+        # Let Qt fill the constant translucent backdrop instead of
+        # alpha-blending the whole screen in every paintEvent.
+        self.setAutoFillBackground(True)
+        palette = self.palette()
+        palette.setColor(self.backgroundRole(), self._dim_color)
+        self.setPalette(palette)
+        self._pen_outer = QtGui.QPen(QtGui.QColor("#ffba08"), 6)
+        self._brush_outer = QtGui.QBrush(QtGui.QColor("#ffba08"))
+        self._pen_inner = QtGui.QPen(QtGui.QColor("#1d4ed8"), 3)
+        self._brush_inner = QtGui.QBrush(QtGui.QColor("#2563eb"))
+        self._title_font = QtGui.QFont()
+        self._title_font.setPointSize(28)
+        self._title_font.setBold(True)
+        self._title_pen = QtGui.QPen(QtGui.QColor("#e2e8f0"))
+        # Message text rarely changes between repaints; rasterising it once
+        # per change and blitting the pixmap keeps glyph layout out of the
+        # damage-rect repaints driven by the moving target.
+        self._text_pixmap: Optional[QtGui.QPixmap] = None
         self.hide()
 
     def set_target(
@@ -182,18 +364,58 @@ class CalibrationOverlayWindow(QtWidgets.QWidget):
             self.windowHandle().setScreen(screen)
         geometry = screen.geometry()
         self.setGeometry(geometry)
+        message_changed = message != self._message
         self._target = target
         self._message = message
+        if message_changed or self._text_pixmap is None or self._text_pixmap.width() != self.width():
+            self._render_message_pixmap()
         if not self.isVisible():
             self.showFullScreen()
             self.raise_()
-        self.update()
+            self._prev_target_px = None
+            self.update()
+            return
+        # Only the target disk (and, when changed, the text band) moves
+        # between repaints; invalidating just those regions avoids
+        # recompositing the whole translucent screen.
+        tx = int(max(0.0, min(1.0, target[0])) * self.width())
+        ty = int(max(0.0, min(1.0, target[1])) * self.height())
+        damage = self._target_damage_rect(tx, ty)
+        if self._prev_target_px is not None:
+            damage = damage.united(self._target_damage_rect(*self._prev_target_px))
+        if message_changed:
+            damage = damage.united(QtCore.QRect(0, int(self.height() * 0.1), self.width(), 60))
+        self._prev_target_px = (tx, ty)
+        self.update(damage)
+
+    def _render_message_pixmap(self) -> None:
+        if not self._message or self.width() <= 0:
+            self._text_pixmap = None
+            return
+        pixmap = QtGui.QPixmap(self.width(), 60)
+        pixmap.fill(QtCore.Qt.transparent)
+        painter = QtGui.QPainter(pixmap)
+        painter.setPen(self._title_pen)
+        painter.setFont(self._title_font)
+        painter.drawText(
+            pixmap.rect(),
+            QtCore.Qt.AlignHCenter | QtCore.Qt.AlignTop,
+            self._message,
+        )
+        painter.end()
+        self._text_pixmap = pixmap
+
+    @staticmethod
+    def _target_damage_rect(tx: int, ty: int) -> QtCore.QRect:
+        # Outer disk radius 22 plus a 6px pen, padded for antialiasing.
+        return QtCore.QRect(tx - 35, ty - 35, 70, 70)
 
     def clear_target(self) -> None:
         if self._target is None and not self.isVisible():
             return
         self._target = None
         self._message = ""
+        self._text_pixmap = None
         self.hide()
 
     def current_target(self) -> Optional[Tuple[float, float]]:
@@ -204,30 +426,20 @@ class CalibrationOverlayWindow(QtWidgets.QWidget):
             return
         painter = QtGui.QPainter(self)
         painter.setRenderHint(QtGui.QPainter.Antialiasing)
-        painter.fillRect(self.rect(), QtGui.QColor(9, 14, 23, 120))
         width = self.width()
         height = self.height()
-        tx = int(np.clip(self._target[0], 0.0, 1.0) * width)
-        ty = int(np.clip(self._target[1], 0.0, 1.0) * height)
+        tx = int(max(0.0, min(1.0, self._target[0])) * width)
+        ty = int(max(0.0, min(1.0, self._target[1])) * height)
 
-        painter.setPen(QtGui.QPen(QtGui.QColor("#ffba08"), 6))
-        painter.setBrush(QtGui.QColor("#ffba08"))
+        painter.setPen(self._pen_outer)
+        painter.setBrush(self._brush_outer)
         painter.drawEllipse(QtCore.QPoint(tx, ty), 22, 22)
-        painter.setBrush(QtGui.QBrush(QtGui.QColor("#2563eb")))
-        painter.setPen(QtGui.QPen(QtGui.QColor("#1d4ed8"), 3))
+        painter.setBrush(self._brush_inner)
+        painter.setPen(self._pen_inner)
         painter.drawEllipse(QtCore.QPoint(tx, ty), 10, 10)
 
-        if self._message:
-            painter.setPen(QtGui.QColor("#e2e8f0"))
-            font = painter.font()
-            font.setPointSize(28)
-            font.setBold(True)
-            painter.setFont(font)
-            painter.drawText(
-                QtCore.QRect(0, int(height * 0.1), width, 60),
-                QtCore.Qt.AlignHCenter | QtCore.Qt.AlignTop,
-                self._message,
-            )
+        if self._text_pixmap is not None:
+            painter.drawPixmap(0, int(height * 0.1), self._text_pixmap)
         painter.end()
 
 
@@ -291,6 +503,28 @@ class MainWindow(QtWidgets.QMainWindow):
         self._overlay_preview = OverlayPreview()
         self._current_calibration_message: str = ""
 
+        # Coalesce incoming tracker frames: only the most recent frame is
+        # kept and painted on a display-rate timer, so a camera running
+        # faster than the screen refresh cannot queue up paint work.
+        self._renderer = FrameRenderer()
+        self._pending_frame: Optional[Tuple[QtGui.QImage, Dict]] = None
+        self._paint_timer = QtCore.QTimer(self)
+        self._paint_timer.setTimerType(QtCore.Qt.PreciseTimer)
+        self._paint_timer.setInterval(16)
+        self._paint_timer.timeout.connect(self._flush_frame)
+        self._paint_timer.start()
+
+        # Spin boxes fire valueChanged on every tick while dragging or
+        # holding arrow keys; coalesce those into one settings push.
+        self._settings_timer = QtCore.QTimer(self)
+        self._settings_timer.setSingleShot(True)
+        self._settings_timer.setInterval(150)
+        self._settings_timer.timeout.connect(self._flush_settings)
+        # Per-group dirty flags: the flush must only write back groups the
+        # user actually touched, or it would clobber calibration results
+        # that land inside the debounce window.
+        self._dirty_settings: set = set()
+
         central = QtWidgets.QWidget()
         self.setCentralWidget(central)
         layout = QtWidgets.QHBoxLayout(central)
@@ -470,7 +704,9 @@ class MainWindow(QtWidgets.QMainWindow):
         return container
 
     def _connect_signals(self) -> None:
-        self._tracker.frame_ready.connect(self._on_frame_ready)
+        # Direct connection: overlay drawing and QImage wrapping run on the
+        # tracker thread, leaving only the pixmap upload for the GUI thread.
+        self._tracker.frame_ready.connect(self._on_frame_ready, QtCore.Qt.DirectConnection)
         self._tracker.status_updated.connect(self._on_status_update)
         self._tracker.calibration_step.connect(self._on_calibration_step)
         self._tracker.calibration_finished.connect(self._on_calibration_finished)
@@ -478,12 +714,23 @@ class MainWindow(QtWidgets.QMainWindow):
         self._tracker.error_occurred.connect(self._on_error)
 
     def _on_frame_ready(self, frame: np.ndarray, payload: Dict) -> None:
-        landmarks = payload.get("landmarks")
+        # Runs on the tracker thread (direct connection).
+        image = self._renderer.render(
+            frame,
+            payload.get("landmarks"),
+            payload.get("head_angles"),
+            payload.get("gaze_vector"),
+            payload.get("iris_positions"),
+        )
+        self._pending_frame = (image, payload)
+
+    def _flush_frame(self) -> None:
+        if self._pending_frame is None:
+            return
+        image, payload = self._pending_frame
+        self._pending_frame = None
         target = payload.get("calibration_target")
-        head_angles = payload.get("head_angles")
-        gaze_vector = payload.get("gaze_vector")
-        iris_positions = payload.get("iris_positions")
-        self._video_widget.set_frame(frame, landmarks, head_angles, gaze_vector, iris_positions)
+        self._video_widget.set_image(image)
         if target:
             screen = self.screen() or QtGui.QGuiApplication.primaryScreen()
             if screen:
@@ -577,6 +824,7 @@ class MainWindow(QtWidgets.QMainWindow):
 
     def closeEvent(self, event: QtGui.QCloseEvent) -> None:  # noqa: D401
         self._tracker.stop()
+        self._calibration_manager.save()
         self._overlay_window.close()
         self._calibration_overlay.close()
         super().closeEvent(event)
@@ -628,32 +876,51 @@ class MainWindow(QtWidgets.QMainWindow):
                     spin.setValue(value)
 
     def _on_head_threshold_changed(self) -> None:
-        thresholds = tuple(self._head_threshold_spins[axis].value() for axis in ("yaw", "pitch", "roll"))
-        self._calibration_manager.update_head_pose_thresholds(thresholds)  # type: ignore[arg-type]
+        self._dirty_settings.add("head")
+        self._settings_timer.start()
 
     def _on_gaze_threshold_changed(self) -> None:
-        horizontal = (
-            self._gaze_range_spins["horizontal_min"].value(),
-            self._gaze_range_spins["horizontal_max"].value(),
-        )
-        vertical = (
-            self._gaze_range_spins["vertical_min"].value(),
-            self._gaze_range_spins["vertical_max"].value(),
-        )
-        self._calibration_manager.update_gaze_ranges(horizontal, vertical)  # type: ignore[arg-type]
+        self._dirty_settings.add("gaze")
+        self._settings_timer.start()
 
     def _on_overlay_config_changed(self) -> None:
-        width = self._overlay_width_spin.value()
-        height = self._overlay_height_spin.value()
-        pos_x = self._overlay_pos_x_spin.value()
-        pos_y = self._overlay_pos_y_spin.value()
-        self._calibration_manager.update_settings(
-            overlay_width=width,
-            overlay_height=height,
-            overlay_pos_x=pos_x,
-            overlay_pos_y=pos_y,
-        )
-        self._apply_overlay_settings(width, height, pos_x, pos_y)
+        self._dirty_settings.add("overlay")
+        self._settings_timer.start()
+
+    def _flush_settings(self) -> None:
+        """Push the spin-box values of the touched groups to the manager."""
+        dirty = self._dirty_settings
+        self._dirty_settings = set()
+
+        if "head" in dirty:
+            thresholds = tuple(
+                self._head_threshold_spins[axis].value() for axis in ("yaw", "pitch", "roll")
+            )
+            self._calibration_manager.update_head_pose_thresholds(thresholds)  # type: ignore[arg-type]
+
+        if "gaze" in dirty:
+            horizontal = (
+                self._gaze_range_spins["horizontal_min"].value(),
+                self._gaze_range_spins["horizontal_max"].value(),
+            )
+            vertical = (
+                self._gaze_range_spins["vertical_min"].value(),
+                self._gaze_range_spins["vertical_max"].value(),
+            )
+            self._calibration_manager.update_gaze_ranges(horizontal, vertical)  # type: ignore[arg-type]
+
+        if "overlay" in dirty:
+            width = self._overlay_width_spin.value()
+            height = self._overlay_height_spin.value()
+            pos_x = self._overlay_pos_x_spin.value()
+            pos_y = self._overlay_pos_y_spin.value()
+            self._calibration_manager.update_settings(
+                overlay_width=width,
+                overlay_height=height,
+                overlay_pos_x=pos_x,
+                overlay_pos_y=pos_y,
+            )
+            self._apply_overlay_settings(width, height, pos_x, pos_y)
 
     def _apply_overlay_settings(self, width: int, height: int, pos_x: float, pos_y: float) -> None:
         self._overlay_window.configure(width, height, pos_x, pos_y)
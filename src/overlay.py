@@ -2,8 +2,14 @@
 
 from __future__ import annotations
 
+from typing import Optional
+
 from PySide6 import QtCore, QtGui, QtWidgets
 
+try:
+    from .utils import clamp
+except ImportError:
+    from utils import clamp
 
 class OverlayWindow(QtWidgets.QWidget):
     """Transparent overlay window that shows warning messages."""
@@ -12,38 +18,44 @@ class OverlayWindow(QtWidgets.QWidget):
         super().__init__(None, QtCore.Qt.Tool | QtCore.Qt.WindowStaysOnTopHint | QtCore.Qt.FramelessWindowHint)
         self.setAttribute(QtCore.Qt.WA_TranslucentBackground, True)
         self.setAttribute(QtCore.Qt.WA_ShowWithoutActivating, True)
+        self.setAttribute(QtCore.Qt.WA_NoSystemBackground, True)
         self._message = ""
         self._size = QtCore.QSize(360, 140)
         self._position_percent = QtCore.QPointF(50.0, 12.0)
-
-        self._label = QtWidgets.QLabel("", self)
-        self._label.setAlignment(QtCore.Qt.AlignCenter)
-        self._label.setWordWrap(True)
-        self._label.setStyleSheet(
-            """
-            QLabel {
-                color: #0f172a;
-                background-color: rgba(254, 226, 226, 230);
-                border-radius: 14px;
-                padding: 20px 28px;
-                font-size: 18px;
-                font-weight: 600;
-            }
-            """
+        # Screen lookups round-trip into native enumeration; cache the
+        # geometry and refresh it from Qt's change signals instead.
+        self._cached_rect: Optional[QtCore.QRect] = None
+        self._screen: Optional[QtGui.QScreen] = QtGui.QGuiApplication.primaryScreen()
+        self._screen_geo: Optional[QtCore.QRect] = (
+            self._screen.availableGeometry() if self._screen else None
         )
-        layout = QtWidgets.QVBoxLayout(self)
-        layout.setContentsMargins(0, 0, 0, 0)
-        layout.addWidget(self._label, alignment=QtCore.Qt.AlignCenter)
+        app = QtGui.QGuiApplication.instance()
+        if app is not None:
+            app.primaryScreenChanged.connect(self._on_primary_screen_changed)
+        if self._screen is not None:
+            self._screen.availableGeometryChanged.connect(self._refresh_screen_geo)
+
+        # Drawing the rounded panel and text directly skips the QLabel,
+        # layout and stylesheet-parser chain entirely; the paint resources
+        # below are built once and reused across repaints.
+        self._panel_brush = QtGui.QBrush(QtGui.QColor(254, 226, 226, 230))
+        self._text_pen = QtGui.QPen(QtGui.QColor("#0f172a"))
+        self._text_font = QtGui.QFont()
+        self._text_font.setPixelSize(18)
+        self._text_font.setWeight(QtGui.QFont.DemiBold)
         self.setMinimumSize(200, 100)
         self.hide()
 
     def configure(self, width: int, height: int, pos_x_percent: float, pos_y_percent: float) -> None:
         width = max(160, width)
         height = max(80, height)
-        pos_x_percent = max(0.0, min(pos_x_percent, 100.0))
-        pos_y_percent = max(0.0, min(pos_y_percent, 100.0))
+        pos_x_percent = clamp(pos_x_percent, 0.0, 100.0)
+        pos_y_percent = clamp(pos_y_percent, 0.0, 100.0)
         self._size = QtCore.QSize(width, height)
         self._position_percent = QtCore.QPointF(pos_x_percent, pos_y_percent)
+        # Doing the geometry math here keeps _apply_geometry - which runs
+        # on the GUI thread during show/raise - down to one setGeometry.
+        self._recompute_rect()
         if self.isVisible():
             self._apply_geometry()
 
@@ -52,34 +64,69 @@ class OverlayWindow(QtWidgets.QWidget):
             return
         self._message = message
         if message:
-            self._label.setText(message)
-            self._apply_geometry()
-            self.show()
-            self.raise_()
+            # show()/raise_() round-trip into the window system even when
+            # the window is already up; only pay for them on first show.
+            if not self.isVisible():
+                self._apply_geometry()
+                self.show()
+                self.raise_()
+            self.update()
         else:
-            self._label.clear()
             self.hide()
 
-    def resizeEvent(self, event: QtGui.QResizeEvent) -> None:  # noqa: D401
-        super().resizeEvent(event)
-        if self._label:
-            self._label.setFixedSize(self.size())
+    def paintEvent(self, event: QtGui.QPaintEvent) -> None:  # noqa: D401
+        if not self._message:
+            return
+        painter = QtGui.QPainter(self)
+        painter.setRenderHint(QtGui.QPainter.Antialiasing)
+        painter.setPen(QtCore.Qt.NoPen)
+        painter.setBrush(self._panel_brush)
+        painter.drawRoundedRect(self.rect(), 14, 14)
+        painter.setPen(self._text_pen)
+        painter.setFont(self._text_font)
+        painter.drawText(
+            self.rect().adjusted(28, 20, -28, -20),
+            QtCore.Qt.AlignCenter | QtCore.Qt.TextWordWrap,
+            self._message,
+        )
+        painter.end()
 
-    def _apply_geometry(self) -> None:
-        screen = QtGui.QGuiApplication.primaryScreen()
-        if not screen:
-            self.resize(self._size)
+    def _on_primary_screen_changed(self, screen: Optional[QtGui.QScreen]) -> None:
+        if self._screen is not None:
+            self._screen.availableGeometryChanged.disconnect(self._refresh_screen_geo)
+        self._screen = screen
+        if self._screen is not None:
+            self._screen.availableGeometryChanged.connect(self._refresh_screen_geo)
+        self._refresh_screen_geo()
+
+    def _refresh_screen_geo(self) -> None:
+        self._screen_geo = self._screen.availableGeometry() if self._screen else None
+        self._recompute_rect()
+        if self.isVisible():
+            self._apply_geometry()
+
+    def _recompute_rect(self) -> None:
+        geometry = self._screen_geo
+        if geometry is None:
+            self._cached_rect = None
             return
-        geometry = screen.availableGeometry()
         width = min(self._size.width(), geometry.width())
         height = min(self._size.height(), geometry.height())
         x_ratio = self._position_percent.x() / 100.0
         y_ratio = self._position_percent.y() / 100.0
-        x_ratio = max(0.0, min(x_ratio, 1.0))
-        y_ratio = max(0.0, min(y_ratio, 1.0))
+        x_ratio = clamp(x_ratio, 0.0, 1.0)
+        y_ratio = clamp(y_ratio, 0.0, 1.0)
         available_x = geometry.width() - width
         available_y = geometry.height() - height
         x = geometry.left() + int(available_x * x_ratio)
         y = geometry.top() + int(available_y * y_ratio)
-        self.setGeometry(x, y, width, height)
+        self._cached_rect = QtCore.QRect(x, y, width, height)
+
+    def _apply_geometry(self) -> None:
+        if self._cached_rect is None:
+            self._recompute_rect()
+        if self._cached_rect is None:
+            self.resize(self._size)
+            return
+        self.setGeometry(self._cached_rect)
 
@@ -2,53 +2,141 @@
 
 from __future__ import annotations
 
+import _thread
 import json
 import math
-import threading
-from collections import deque
+import os
 from pathlib import Path
-from typing import Deque, Dict, Iterable, List, Optional, Tuple
+from typing import Dict, Iterable, List, Optional, Tuple
 
-import cv2
 import numpy as np
 
+try:
+    from numba import njit
+except ImportError:  # pragma: no cover - numba is optional
+    njit = None
+
+try:
+    import orjson
+
+    def _json_loads(raw: bytes) -> Dict:
+        return orjson.loads(raw)
+
+    def _json_dumps(data: Dict) -> bytes:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+
+except ImportError:  # orjson is optional; stdlib json is the fallback
+
+    def _json_loads(raw: bytes) -> Dict:
+        return json.loads(raw)
+
+    def _json_dumps(data: Dict) -> bytes:
+        return json.dumps(data, indent=2).encode("utf-8")
+
 
 class MovingAverageFilter:
-    """Simple moving average filter for scalar or vector values."""
+    """Simple moving average filter for scalar or vector values.
+
+    Samples are stored in a fixed-size ring buffer with a running sum so
+    each update is O(dim) regardless of the window size.
+    """
 
     def __init__(self, window_size: int = 5) -> None:
         if window_size <= 0:
             raise ValueError("window_size must be positive")
         self.window_size = window_size
-        self._buffer: Deque[np.ndarray] = deque(maxlen=window_size)
-        self._lock = threading.Lock()
+        self._buffer: Optional[np.ndarray] = None  # allocated once dim is known
+        self._sum: Optional[np.ndarray] = None
+        self._out: Optional[np.ndarray] = None
+        self._index = 0
+        self._count = 0
+        # The raw lock skips the threading.Lock wrapper; capture and GUI
+        # threads contend on this at frame rate.
+        self._lock = _thread.allocate_lock()
 
     def reset(self) -> None:
         """Reset the buffer."""
         with self._lock:
-            self._buffer.clear()
+            if self._buffer is not None:
+                self._buffer.fill(0.0)
+                self._sum.fill(0.0)
+            self._index = 0
+            self._count = 0
+
+    def resize(self, window_size: int) -> None:
+        """Change the window size, discarding accumulated samples."""
+        if window_size <= 0:
+            raise ValueError("window_size must be positive")
+        with self._lock:
+            self.window_size = window_size
+            self._buffer = None
+            self._sum = None
+            self._out = None
+            self._index = 0
+            self._count = 0
 
     def add(self, value: Iterable[float]) -> np.ndarray:
-        """Add a value and return the current average."""
-        array = np.array(value, dtype=np.float32)
+        """Add a value and return the current average.
+
+        The returned array is a reused scratch buffer overwritten by the
+        next ``add``; callers that keep the result must copy it.
+        """
+        if isinstance(value, np.ndarray):
+            # Upstream already hands us float32 vectors; skip the copy.
+            array = value.astype(np.float32, copy=False)
+        else:
+            array = np.fromiter(value, dtype=np.float32)
         with self._lock:
-            self._buffer.append(array)
-            stacked = np.stack(self._buffer, axis=0)
-        return np.mean(stacked, axis=0)
+            if self._buffer is None:
+                self._buffer = np.zeros((self.window_size, array.size), dtype=np.float32)
+                self._sum = np.zeros(array.size, dtype=np.float32)
+                self._out = np.empty(array.size, dtype=np.float32)
+            self._sum += array - self._buffer[self._index]
+            self._buffer[self._index] = array
+            self._index = (self._index + 1) % self.window_size
+            self._count = min(self._count + 1, self.window_size)
+            # Dividing into the scratch buffer keeps the steady state
+            # allocation-free; it stays inside the lock so the sum cannot
+            # shift under the divide.
+            np.divide(self._sum, self._count, out=self._out)
+        return self._out
 
 
-def rotation_vector_to_euler(rvec: np.ndarray) -> Tuple[float, float, float]:
-    """Convert a rotation vector to yaw, pitch, roll in degrees."""
-    rotation_matrix, _ = cv2.Rodrigues(rvec)
-    sy = math.sqrt(rotation_matrix[0, 0] ** 2 + rotation_matrix[1, 0] ** 2)
-    singular = sy < 1e-6
-    if not singular:
-        pitch = math.atan2(rotation_matrix[2, 1], rotation_matrix[2, 2])
-        yaw = math.atan2(-rotation_matrix[2, 0], sy)
-        roll = math.atan2(rotation_matrix[1, 0], rotation_matrix[0, 0])
+# Note on the two rotation converters below: the scalar path must keep
+# using the math module (math.atan2/sqrt/sin/cos) — routing single values
+# through NumPy ufuncs builds a 0-d array per call and is roughly an
+# order of magnitude slower. The batched path is the opposite: np.arctan2
+# and friends on contiguous arrays amortise the dispatch. Do not unify them.
+def _rvec_to_euler_scalar(rx: float, ry: float, rz: float) -> Tuple[float, float, float]:
+    """Scalar Rodrigues expansion feeding the Euler extraction.
+
+    Only the five rotation-matrix entries the atan2 extraction reads are
+    computed, from R = I + sin(theta) K + (1 - cos(theta)) K^2.
+    """
+    theta_sq = rx * rx + ry * ry + rz * rz
+    if theta_sq < 1e-16:
+        return (0.0, 0.0, 0.0)
+    theta = math.sqrt(theta_sq)
+    kx = rx / theta
+    ky = ry / theta
+    kz = rz / theta
+    s = math.sin(theta)
+    c = 1.0 - math.cos(theta)
+    r00 = 1.0 + c * (kx * kx - 1.0)
+    r10 = s * kz + c * kx * ky
+    r20 = -s * ky + c * kx * kz
+    r21 = s * kx + c * ky * kz
+    r22 = 1.0 + c * (kz * kz - 1.0)
+    sy = math.sqrt(r00 * r00 + r10 * r10)
+    if sy >= 1e-6:
+        pitch = math.atan2(r21, r22)
+        yaw = math.atan2(-r20, sy)
+        roll = math.atan2(r10, r00)
     else:
-        pitch = math.atan2(-rotation_matrix[1, 2], rotation_matrix[1, 1])
-        yaw = math.atan2(-rotation_matrix[2, 0], sy)
+        r11 = 1.0 + c * (ky * ky - 1.0)
+        r12 = -s * kx + c * ky * kz
+        pitch = math.atan2(-r12, r11)
+        yaw = math.atan2(-r20, sy)
         roll = 0.0
     return (
         math.degrees(yaw),
@@ -57,32 +145,115 @@ def rotation_vector_to_euler(rvec: np.ndarray) -> Tuple[float, float, float]:
     )
 
 
+if njit is not None:
+    # Compile the scalar kernel to native code; it sits on the per-frame
+    # head-pose path. Warm it up at import so the first frame does not
+    # pay the compile cost.
+    _rvec_to_euler_scalar = njit(cache=True, fastmath=True)(_rvec_to_euler_scalar)
+    _rvec_to_euler_scalar(0.0, 0.1, 0.0)
+
+
+def rotation_vector_to_euler(rvec: np.ndarray) -> Tuple[float, float, float]:
+    """Convert a rotation vector to yaw, pitch, roll in degrees."""
+    # The closed-form expansion avoids a cv2.Rodrigues round trip (full
+    # 3x3 matrix plus Jacobian) just to read a handful of entries.
+    flat = np.asarray(rvec, dtype=np.float64).reshape(3)
+    return _rvec_to_euler_scalar(float(flat[0]), float(flat[1]), float(flat[2]))
+
+
+def rotation_vectors_to_euler(rvecs: np.ndarray) -> np.ndarray:
+    """Convert a stack of rotation vectors to Euler angles in degrees.
+
+    Accepts an (N, 3) array and returns (N, 3) yaw, pitch, roll rows in
+    one broadcast pass; use :func:`rotation_vector_to_euler` for single
+    vectors.
+    """
+    rvecs = np.asarray(rvecs, dtype=np.float64).reshape(-1, 3)
+    if rvecs.shape[0] == 1:
+        yaw, pitch, roll = _rvec_to_euler_scalar(rvecs[0, 0], rvecs[0, 1], rvecs[0, 2])
+        return np.array([[yaw, pitch, roll]])
+    rx, ry, rz = rvecs[:, 0], rvecs[:, 1], rvecs[:, 2]
+    theta_sq = rx * rx + ry * ry + rz * rz
+    theta = np.sqrt(theta_sq)
+    mask = theta > 1e-8
+    safe_theta = np.where(mask, theta, 1.0)
+    safe_theta_sq = np.where(mask, theta_sq, 1.0)
+    # Taylor limits sin(t)/t -> 1 and (1-cos(t))/t^2 -> 0.5 keep tiny
+    # rotations finite instead of dividing by ~0.
+    s = np.where(mask, np.sin(theta) / safe_theta, 1.0)
+    c = np.where(mask, (1.0 - np.cos(theta)) / safe_theta_sq, 0.5)
+    r00 = 1.0 + c * (rx * rx - theta_sq)
+    r10 = s * rz + c * rx * ry
+    r20 = -s * ry + c * rx * rz
+    r21 = s * rx + c * ry * rz
+    r22 = 1.0 + c * (rz * rz - theta_sq)
+    r11 = 1.0 + c * (ry * ry - theta_sq)
+    r12 = -s * rx + c * ry * rz
+    sy = np.sqrt(r00 * r00 + r10 * r10)
+    regular = sy >= 1e-6
+    yaw = np.arctan2(-r20, sy)
+    pitch = np.where(regular, np.arctan2(r21, r22), np.arctan2(-r12, r11))
+    roll = np.where(regular, np.arctan2(r10, r00), 0.0)
+    return np.degrees(np.stack((yaw, pitch, roll), axis=1))
+
+
 def load_json(path: Path, default: Optional[Dict] = None) -> Dict:
     """Load JSON data from a file or return default."""
+    p = path if isinstance(path, Path) else Path(path)
     try:
-        with Path(path).open("r", encoding="utf-8") as handle:
-            return json.load(handle)
+        return _json_loads(p.read_bytes())
     except FileNotFoundError:
         return default.copy() if default else {}
-    except json.JSONDecodeError:
+    except ValueError:  # covers json and orjson decode errors
         return default.copy() if default else {}
 
 
 def save_json(path: Path, data: Dict) -> None:
-    """Persist JSON data atomically."""
-    tmp_path = Path(f"{path}.tmp")
-    with tmp_path.open("w", encoding="utf-8") as handle:
-        json.dump(data, handle, indent=2)
-    tmp_path.replace(path)
+    """Persist JSON data atomically and durably."""
+    path = path if isinstance(path, Path) else Path(path)
+    # with_suffix reuses the parsed components instead of reparsing a
+    # formatted string.
+    tmp_path = path.with_suffix(path.suffix + ".tmp")
+    payload = _json_dumps(data)
+    # O_DSYNC folds the data flush into the write syscall, saving a
+    # separate fsync round trip. The temp file must hit disk before the
+    # rename; otherwise a crash can leave a zero-length or stale config
+    # behind the atomically renamed name.
+    dsync = getattr(os, "O_DSYNC", 0)
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | dsync, 0o644)
+    try:
+        os.write(fd, payload)
+        if dsync == 0:  # e.g. Windows: fall back to an explicit fsync
+            os.fsync(fd)
+    finally:
+        os.close(fd)
+    os.replace(tmp_path, path)
+    if os.name == "posix":
+        # Persist the rename itself by syncing the directory entry.
+        dir_fd = os.open(path.parent, os.O_RDONLY)
+        try:
+            os.fsync(dir_fd)
+        finally:
+            os.close(dir_fd)
 
 
 def clamp(value: float, lower: float, upper: float) -> float:
     """Clamp a value to the provided range."""
-    return max(lower, min(value, upper))
+    # Conditional expressions skip the two builtin-call dispatches of
+    # max(min(...)) on this per-frame helper.
+    return lower if value < lower else upper if value > upper else value
 
 
 def normalise_vector(vec: np.ndarray) -> np.ndarray:
     """Normalise a vector, returning zero vector if magnitude is 0."""
+    if vec.ndim == 1:
+        # A scalar dot plus reciprocal multiply skips the LAPACK-backed
+        # linalg dispatch; for 1-D input the dot is exact regardless of
+        # length, so there is no size cutoff.
+        norm_sq = float(vec @ vec)
+        if norm_sq == 0.0:
+            return np.zeros_like(vec)
+        return vec * (1.0 / math.sqrt(norm_sq))
     norm = np.linalg.norm(vec)
     if norm == 0:
         return np.zeros_like(vec)
@@ -92,16 +263,12 @@ def normalise_vector(vec: np.ndarray) -> np.ndarray:
 def compute_eye_roi(landmarks: List[Tuple[float, float]], scale: Tuple[int, int]) -> Tuple[int, int, int, int]:
     """Compute bounding box for an eye based on landmarks."""
     width, height = scale
-    xs = [int(landmark[0] * width) for landmark in landmarks]
-    ys = [int(landmark[1] * height) for landmark in landmarks]
-    min_x, max_x = min(xs), max(xs)
-    min_y, max_y = min(ys), max(ys)
-    padding_w = max(1, (max_x - min_x) // 4)
-    padding_h = max(1, (max_y - min_y) // 4)
-    return (
-        max(0, min_x - padding_w),
-        max(0, min_y - padding_h),
-        min(width, max_x + padding_w),
-        min(height, max_y + padding_h),
-    )
+    pts = np.asarray(landmarks, dtype=np.float32)
+    pts = (pts * (width, height)).astype(np.int32)
+    mins = pts.min(axis=0)
+    maxs = pts.max(axis=0)
+    padding = np.maximum(1, (maxs - mins) // 4)
+    lower = np.maximum(0, mins - padding)
+    upper = np.minimum((width, height), maxs + padding)
+    return (int(lower[0]), int(lower[1]), int(upper[0]), int(upper[1]))
 